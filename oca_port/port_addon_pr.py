@@ -646,11 +646,24 @@ class BranchesDiff(Output):
         commits = self.app.repo.iter_commits(branch, paths=path)
         commits_list = []
         commits_by_sha = {}
+        commits_files = None
         for commit in commits:
             if self.app.cache.is_commit_ported(commit.hexsha):
                 continue
+            files = self.app.cache.get_commit_files(commit.hexsha)
+            if not files:
+                # Retrieve modified files of all commits at once on the first
+                # cache miss, instead of spawning one git process per commit
+                if commits_files is None:
+                    commits_files = g.get_commits_files(self.app.repo, branch, path)
+                files = commits_files.get(commit.hexsha)
+                if files:
+                    self.app.cache.set_commit_files(commit.hexsha, files)
             com = g.Commit(
-                commit, addons_path=self.app.addons_rootdir, cache=self.app.cache
+                commit,
+                addons_path=self.app.addons_rootdir,
+                cache=self.app.cache,
+                files=files,
             )
             if self._skip_commit(com):
                 continue
@@ -966,12 +979,14 @@ class BranchesDiff(Output):
             # Get all commits of the PR as they could update others addons
             # than the one the user is interested in.
             # NOTE: commits fetched from PR are already in the right order
-            pr_number = raw_data["number"]
-            pr_commits_data = self.app.github.request(
-                f"repos/{self.app.upstream_org}/{src_repo_name}"
-                f"/pulls/{pr_number}/commits?per_page=100"
-            )
-            pr_commits = [pr["sha"] for pr in pr_commits_data]
+            pr_commits = raw_data.get("commits")
+            if pr_commits is None:
+                pr_number = raw_data["number"]
+                pr_commits_data = self.app.github.request(
+                    f"repos/{self.app.upstream_org}/{src_repo_name}"
+                    f"/pulls/{pr_number}/commits?per_page=100"
+                )
+                pr_commits = [pr["sha"] for pr in pr_commits_data]
             data = {
                 "number": raw_data["number"],
                 "url": raw_data["html_url"],
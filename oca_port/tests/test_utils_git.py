@@ -0,0 +1,25 @@
+# Copyright 2024 Camptocamp SA
+# License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl)
+
+from oca_port.utils import git as g
+
+from . import common
+
+
+class TestGit(common.CommonCase):
+    def test_get_commits_files(self):
+        self._commit_change_on_branch(
+            self.repo_upstream_path, "15.0", add_satellite_change=True
+        )
+        repo = self._git_repo(self.repo_upstream_path)
+        # Files updated outside of the path are returned too
+        commits_files = g.get_commits_files(repo, "15.0", self.addon)
+        self.assertEqual(len(commits_files), 2)
+        for commit in repo.iter_commits("15.0", paths=self.addon):
+            self.assertEqual(
+                commits_files[commit.hexsha], set(commit.stats.files.keys())
+            )
+        self.assertIn(
+            f"test_{self.addon}/__manifest__.py",
+            commits_files[repo.commit("15.0").hexsha],
+        )
@@ -2,6 +2,7 @@
 # License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl)
 
 import unittest
+from unittest import mock
 
 from oca_port.utils import github
 
@@ -21,3 +22,89 @@ class TestGitHub(unittest.TestCase):
         # Module name is not the expected one: do not match
         res = self.gh._addon_in_text("a_b", "[16.0][MIG] a_b_c: migration to 16.0")
         assert not res
+        res = self.gh._addon_in_text("a_b", "[16.0][MIG] c_a_b: migration to 16.0")
+        assert not res
+        res = self.gh._addon_in_text("a_b", "[16.0][MIG] a_b")
+        assert res
+
+    def test_request_etag(self):
+        response = mock.Mock(
+            ok=True, status_code=200, headers={"ETag": '"abc"'}, json=lambda: [1]
+        )
+        with mock.patch.object(
+            self.gh.session, "request", return_value=response
+        ) as request:
+            self.assertEqual(self.gh.request("repos/ORG/test"), [1])
+            self.assertNotIn("If-None-Match", request.call_args.kwargs["headers"])
+            # Data did not change: cached data is returned
+            response.status_code = 304
+            response.json = lambda: None
+            self.assertEqual(self.gh.request("repos/ORG/test"), [1])
+            self.assertEqual(
+                request.call_args.kwargs["headers"]["If-None-Match"], '"abc"'
+            )
+
+    def test_get_original_pr_rest(self):
+        # No token: REST API is used
+        self.gh.token = None
+
+        def _pull(number, branch):
+            return {
+                "number": number,
+                "base": {"ref": branch, "repo": {"full_name": "ORG/test"}},
+                "commits_url": f"pulls/{number}/commits",
+            }
+
+        responses = {
+            "repos/ORG/test/commits/abc/pulls": [
+                _pull(1, "15.0"),
+                _pull(2, "16.0"),
+                _pull(3, "16.0"),
+            ],
+            "pulls/2/commits": [{"sha": "def"}],
+            "pulls/3/commits": [{"sha": "def"}, {"sha": "abc"}],
+        }
+        with mock.patch.object(
+            self.gh, "request", side_effect=lambda url: responses[url]
+        ) as request:
+            res = self.gh.get_original_pr("ORG", "test", "16.0", "abc")
+            self.assertEqual(res["number"], 3)
+            # Commits of PRs targeting another branch are not fetched
+            self.assertNotIn(mock.call("pulls/1/commits"), request.call_args_list)
+            self.assertFalse(self.gh.get_original_pr("ORG", "test", "14.0", "abc"))
+
+    def test_get_original_pr_graphql(self):
+        def _pull(number, branch, shas):
+            return {
+                "number": number,
+                "url": f"https://github.com/ORG/test/pull/{number}",
+                "author": {"login": "john"},
+                "title": "title",
+                "body": "body",
+                "mergedAt": "2023-01-01T00:00:00Z",
+                "baseRefName": branch,
+                "baseRepository": {"nameWithOwner": "ORG/test"},
+                "commits": {"nodes": [{"commit": {"oid": sha}} for sha in shas]},
+            }
+
+        data = {
+            "repository": {
+                "object": {
+                    "associatedPullRequests": {
+                        "nodes": [
+                            _pull(1, "15.0", ["abc"]),
+                            _pull(2, "16.0", ["def"]),
+                            _pull(3, "16.0", ["def", "abc"]),
+                        ]
+                    }
+                }
+            }
+        }
+        with mock.patch.object(self.gh, "graphql", return_value=data) as graphql:
+            res = self.gh.get_original_pr("ORG", "test", "16.0", "abc")
+            graphql.assert_called_once()
+            self.assertEqual(res["number"], 3)
+            self.assertEqual(res["html_url"], "https://github.com/ORG/test/pull/3")
+            self.assertEqual(res["user"]["login"], "john")
+            self.assertEqual(res["commits"], ["def", "abc"])
+            self.assertFalse(self.gh.get_original_pr("ORG", "test", "14.0", "abc"))
@@ -61,8 +61,12 @@ class Commit:
     other_equality_attrs = ("paths",)
     eq_strict = True
 
-    def __init__(self, commit, addons_path=".", cache=None):
-        """Initializes a new Commit instance from a GitPython Commit object."""
+    def __init__(self, commit, addons_path=".", cache=None, files=None):
+        """Initializes a new Commit instance from a GitPython Commit object.
+
+        Modified `files` can be provided if they are already known (e.g. fetched
+        for several commits at once with `get_commits_files`).
+        """
         self.raw_commit = commit
         self.addons_path = addons_path
         self.cache = cache
@@ -76,7 +80,7 @@ class Commit:
         self.hexsha = commit.hexsha
         self.committed_datetime = commit.committed_datetime.replace(tzinfo=None)
         self.parents = [parent.hexsha for parent in commit.parents]
-        self._files = set()
+        self._files = set(files) if files else set()
         self._paths = set()
         self.ported_commits = []
 
@@ -84,9 +88,8 @@ class Commit:
     def files(self):
         """Returns modified file paths."""
         # Access git storage or cache only on demand to avoid too much IO
-        files = self._get_files()
         if not self._files:
-            self._files = files
+            self._files = self._get_files()
         return self._files
 
     @property
@@ -334,6 +337,27 @@ def get_changed_paths(repo, modified=True, staged=True):
     return [diff.a_path or diff.b_path for diff in changed_diff]
 
 
+def get_commits_files(repo, ref, path="."):
+    """Return file paths modified by each commit of `ref` updating `path`.
+
+    Files of all commits are retrieved with one `git log` call, which is way
+    faster than computing the stats of each commit separately.
+
+    :return: dict {SHA: {file_path, ...}, ...}
+    """
+    commits_files = {}
+    files = None
+    output = repo.git.log(
+        "--name-only", "--no-renames", "--full-diff", "--format=%x00%H", ref, "--", path
+    )
+    for line in output.splitlines():
+        if line.startswith("\x00"):
+            files = commits_files.setdefault(line[1:], set())
+        elif line and files is not None:
+            files.add(line)
+    return commits_files
+
+
 def check_path_exists(repo, ref, path, rootdir=None):
     root_tree = repo.commit(ref).tree
     if rootdir and rootdir != ".":
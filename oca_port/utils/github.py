@@ -6,21 +6,57 @@ import re
 import os
 import subprocess
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urljoin
 
 from .git import PullRequest
 
 GITHUB_API_URL = "https://api.github.com"
 
+ORIGINAL_PR_QUERY = """
+query($org: String!, $repo: String!, $sha: String!) {
+  repository(owner: $org, name: $repo) {
+    object(expression: $sha) {
+      ... on Commit {
+        associatedPullRequests(first: 10) {
+          nodes {
+            number
+            url
+            author { login }
+            title
+            body
+            mergedAt
+            baseRefName
+            baseRepository { nameWithOwner }
+            commits(first: 100) { nodes { commit { oid } } }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
 
 class GitHub:
     def __init__(self, token=None):
         if not token:
             token = self._get_token()
         self.token = token
+        # Reuse the same connection for all requests
+        self.session = requests.Session()
+        # Responses of GET requests indexed by URL: {key: (ETag, data)}
+        self._etag_cache = {}
+        # Compiled patterns used to look for addon names in texts
+        self._addon_re_cache = {}
 
     def request(self, url: str, method: str = "get", params=None, json=None):
-        """Request GitHub API."""
+        """Request GitHub API.
+
+        Responses of GET requests are kept in memory along with their ETag, so
+        further calls on the same URL are conditional requests: if the data did
+        not change GitHub replies with a 304 (not counted in the rate limit).
+        """
         headers = {"Accept": "application/vnd.github.groot-preview+json"}
         if self.token:
             headers.update({"Authorization": f"token {self.token}"})
@@ -28,34 +64,106 @@ class GitHub:
             full_url = url
         else:
             full_url = urljoin(GITHUB_API_URL, url)
+        cache_key = None
+        cached = None
+        if method == "get":
+            cache_key = (full_url, tuple(sorted((params or {}).items())))
+            cached = self._etag_cache.get(cache_key)
+            if cached:
+                headers["If-None-Match"] = cached[0]
         kwargs = {"headers": headers}
         if json:
             kwargs.update(json=json)
         if params:
             kwargs.update(params=params)
-        response = getattr(requests, method)(full_url, **kwargs)
+        response = self.session.request(method, full_url, **kwargs)
+        if cached and response.status_code == 304:
+            return cached[1]
         if not response.ok:
             raise RuntimeError(response.text)
-        return response.json()
+        data = response.json()
+        etag = response.headers.get("ETag")
+        if cache_key and etag:
+            self._etag_cache[cache_key] = (etag, data)
+        return data
+
+    def graphql(self, query: str, variables=None):
+        """Request GitHub GraphQL API."""
+        response = self.request(
+            "graphql",
+            method="post",
+            json={"query": query, "variables": variables or {}},
+        )
+        if response.get("errors"):
+            raise RuntimeError(response["errors"])
+        return response.get("data") or {}
 
     def get_original_pr(
         self, from_org: str, repo_name: str, branch: str, commit_sha: str
     ):
-        """Return original GitHub PR data of a commit."""
+        """Return original GitHub PR data of a commit.
+
+        If a token is available, the GraphQL API is used to get PRs and their
+        commits with one request, and the returned data include the PR commits
+        in a `commits` key. Otherwise fallback on the REST API.
+        """
+        if self.token:
+            return self._get_original_pr_graphql(
+                from_org, repo_name, branch, commit_sha
+            )
         gh_commit_pulls = self.request(
             f"repos/{from_org}/{repo_name}/commits/{commit_sha}/pulls"
         )
-        for data in gh_commit_pulls:
+        candidate_pulls = [
+            data
+            for data in gh_commit_pulls
             if (
                 data["base"]["ref"] == branch
                 and data["base"]["repo"]["full_name"] == f"{from_org}/{repo_name}"
-            ):
-                data2 = self.request(data["commits_url"])
+            )
+        ]
+        if not candidate_pulls:
+            return {}
+        # Fetch commits of candidate PRs concurrently
+        with ThreadPoolExecutor(max_workers=min(8, len(candidate_pulls))) as executor:
+            pulls_commits = executor.map(
+                lambda data: self.request(data["commits_url"]), candidate_pulls
+            )
+            for data, data2 in zip(candidate_pulls, pulls_commits):
                 pr_commits = [d["sha"] for d in data2]
                 if commit_sha in pr_commits:
                     return data
         return {}
 
+    def _get_original_pr_graphql(
+        self, from_org: str, repo_name: str, branch: str, commit_sha: str
+    ):
+        data = self.graphql(
+            ORIGINAL_PR_QUERY,
+            {"org": from_org, "repo": repo_name, "sha": commit_sha},
+        )
+        commit = (data.get("repository") or {}).get("object") or {}
+        pulls = commit.get("associatedPullRequests", {}).get("nodes", [])
+        for pr in pulls:
+            if (
+                pr["baseRefName"] != branch
+                or pr["baseRepository"]["nameWithOwner"] != f"{from_org}/{repo_name}"
+            ):
+                continue
+            pr_commits = [node["commit"]["oid"] for node in pr["commits"]["nodes"]]
+            if commit_sha in pr_commits:
+                # Same keys than the REST API
+                return {
+                    "number": pr["number"],
+                    "html_url": pr["url"],
+                    "user": pr["author"] or {},
+                    "title": pr["title"],
+                    "body": pr["body"],
+                    "merged_at": pr["mergedAt"],
+                    "commits": pr_commits,
+                }
+        return {}
+
     def search_migration_pr(
         self, from_org: str, repo_name: str, branch: str, addon: str
     ):
@@ -85,7 +193,12 @@ class GitHub:
 
     def _addon_in_text(self, addon: str, text: str):
         """Return `True` if `addon` is present in `text`."""
-        return any(addon == term for term in re.split(r"\W+", text))
+        pattern = self._addon_re_cache.get(addon)
+        if not pattern:
+            pattern = self._addon_re_cache[addon] = re.compile(
+                rf"(?<!\w){re.escape(addon)}(?!\w)"
+            )
+        return bool(pattern.search(text))
 
     @staticmethod
     def _get_token():